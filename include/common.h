@@ -92,6 +92,9 @@ typedef enum {
 /* Logging function */
 void civ_log(civ_log_level_t level, const char *format, ...);
 
+/* djb2 string hash; cheap pre-check before strcmp on name lookups */
+uint32_t civ_hash_string(const char *str);
+
 /* Assertion macro */
 #ifdef DEBUG
 #define CIV_ASSERT(condition, message)                                         \
@@ -36,6 +36,11 @@ typedef struct {
   int32_t expansion_frequency;
   civ_personality_type_t personality;
 
+  /* Scratch list of PLAYER settlement indices, kept between threat
+     evaluations so the scan does not allocate every turn */
+  size_t *player_settlements;
+  size_t player_settlement_capacity;
+
   void *game_ptr; /* Opaque pointer to civ_game_t */
 } civ_strategic_ai_t;
 
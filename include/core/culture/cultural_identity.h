@@ -12,10 +12,14 @@
 /* Cultural trait */
 typedef struct {
   char name[STRING_SHORT_LEN];
+  uint32_t name_hash;   /* civ_hash_string(name) */
   civ_float_t strength; /* 0.0 to 1.0 */
   civ_float_t influence;
 } civ_cultural_trait_t;
 
+/* One bit of the 64-bit trait fingerprint per name hash */
+#define CIV_TRAIT_BIT(hash) ((uint64_t)1 << ((hash) & 63))
+
 /* Cultural Value */
 typedef struct {
   char axis[STRING_SHORT_LEN]; /* e.g. "Individualism", "Collectivism" */
@@ -31,6 +35,7 @@ typedef struct {
   civ_cultural_trait_t *traits;
   size_t trait_count;
   size_t trait_capacity;
+  uint64_t trait_fingerprint; /* Bit (name_hash & 63) set per trait */
 
   civ_cultural_value_t *core_values;
   size_t value_count;
@@ -57,8 +57,9 @@ typedef struct {
   civ_market_sentiment_t sentiment;
   civ_float_t market_volatility;
 
-  /* Historical data */
+  /* Historical data (ring buffer, oldest entry at report_head) */
   civ_economic_report_t *reports;
+  size_t report_head;
   size_t report_count;
   size_t report_capacity;
 } civ_market_dynamics_t;
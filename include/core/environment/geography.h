@@ -66,6 +66,7 @@ void civ_geography_init(civ_geography_t* geo, const char* region_name, civ_coord
 civ_result_t civ_geography_add_land_patch(civ_geography_t* geo, const civ_land_patch_t* patch);
 civ_float_t civ_geography_calculate_distance(civ_coordinate_t a, civ_coordinate_t b);
 civ_float_t civ_geography_get_agricultural_area(const civ_geography_t* geo);
+civ_float_t civ_geography_get_land_area(const civ_geography_t* geo, civ_float_t* agricultural_area);
 
 #endif /* CIVILIZATION_GEOGRAPHY_H */
 
@@ -45,14 +45,14 @@ typedef struct {
 typedef struct {
     char id[STRING_SHORT_LEN];
     char border_segment_id[STRING_SHORT_LEN];
-    civ_border_conflict_type_t conflict_type;
     civ_float_t severity;
     char** involved_parties;
     size_t party_count;
     time_t start_date;
     civ_float_t resolution_progress;
-    int32_t casualties;
     civ_float_t economic_impact;
+    civ_border_conflict_type_t conflict_type;  /* 4-byte fields paired to avoid padding */
+    int32_t casualties;
 } civ_border_conflict_t;
 
 /* Dynamic borders system */
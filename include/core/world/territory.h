@@ -22,6 +22,8 @@ typedef struct {
     civ_territory_point_t* boundary_points;  /* Polygon boundary */
     size_t point_count;
     size_t point_capacity;
+    civ_territory_point_t bounds_min;        /* Axis-aligned bounding box */
+    civ_territory_point_t bounds_max;
     
     civ_float_t area;
     civ_coordinate_t centroid;
@@ -12,6 +12,7 @@
 /* Cache entry */
 typedef struct civ_cache_entry {
     char key[STRING_SHORT_LEN];
+    uint32_t key_hash;  /* civ_hash_string(key), checked before strcmp */
     void* data;
     size_t data_size;
     time_t timestamp;
@@ -21,7 +22,8 @@ typedef struct civ_cache_entry {
 
 /* Cache structure */
 typedef struct {
-    civ_cache_entry_t* entries;
+    civ_cache_entry_t* entries;  /* Insertion order, oldest first */
+    civ_cache_entry_t* tail;     /* Newest entry, for O(1) append */
     size_t entry_count;
     size_t max_entries;
     size_t max_size;
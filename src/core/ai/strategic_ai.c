@@ -31,6 +31,7 @@ void civ_strategic_ai_destroy(civ_strategic_ai_t *ai) {
     civ_base_ai_destroy(ai->base_ai);
   }
   CIV_FREE(ai->goals);
+  CIV_FREE(ai->player_settlements);
   CIV_FREE(ai);
 }
 
@@ -264,24 +265,46 @@ civ_result_t civ_strategic_ai_evaluate_threats(civ_strategic_ai_t *ai,
 
   /* 1. Calculate Border Friction */
   float min_dist = 1000.0f;
-  if (game->settlement_manager) {
-    for (size_t i = 0; i < game->settlement_manager->settlement_count; i++) {
-      civ_settlement_t *s1 = &game->settlement_manager->settlements[i];
+  civ_settlement_manager_t *sm = game->settlement_manager;
+  if (sm && sm->settlement_count > 0) {
+    /* Gather player settlements once so the pairwise scan below does no
+       string compares and only one sqrt for the winning pair. */
+    if (ai->player_settlement_capacity < sm->settlement_count) {
+      size_t *grown = (size_t *)CIV_REALLOC(
+          ai->player_settlements, sm->settlement_count * sizeof(size_t));
+      if (!grown) {
+        civ_log(CIV_LOG_ERROR, "Failed to grow player settlement list for %s",
+                ai->base_ai->id);
+        return (civ_result_t){CIV_ERROR_OUT_OF_MEMORY,
+                              "Player settlement list"};
+      }
+      ai->player_settlements = grown;
+      ai->player_settlement_capacity = sm->settlement_count;
+    }
+
+    size_t *player = ai->player_settlements;
+    size_t player_count = 0;
+    for (size_t j = 0; j < sm->settlement_count; j++) {
+      if (strcmp(sm->settlements[j].region_id, "PLAYER") == 0)
+        player[player_count++] = j;
+    }
+
+    float min_dist_sq = min_dist * min_dist;
+    for (size_t i = 0; i < sm->settlement_count && player_count > 0; i++) {
+      const civ_settlement_t *s1 = &sm->settlements[i];
       if (strcmp(s1->region_id, ai->base_ai->id) != 0)
         continue;
 
-      for (size_t j = 0; j < game->settlement_manager->settlement_count; j++) {
-        civ_settlement_t *s2 = &game->settlement_manager->settlements[j];
-        if (strcmp(s2->region_id, "PLAYER") != 0)
-          continue;
-
-        float dx = s1->x - s2->x;
-        float dy = s1->y - s2->y;
-        float d = sqrtf(dx * dx + dy * dy);
-        if (d < min_dist)
-          min_dist = d;
+      for (size_t j = 0; j < player_count; j++) {
+        const civ_settlement_t *s2 = &sm->settlements[player[j]];
+        float dx = (float)(s1->x - s2->x);
+        float dy = (float)(s1->y - s2->y);
+        float d_sq = dx * dx + dy * dy;
+        if (d_sq < min_dist_sq)
+          min_dist_sq = d_sq;
       }
     }
+    min_dist = sqrtf(min_dist_sq);
   }
 
   /* Opinion modifiers */
@@ -148,12 +148,17 @@ civ_result_t civ_assimilation_tracker_update(
       /* Diffuse traits from source to target */
       for (size_t j = 0; j < source->trait_count; j++) {
         const char *trait_name = source->traits[j].name;
+        uint32_t trait_hash = source->traits[j].name_hash;
         civ_float_t source_strength = source->traits[j].strength;
 
         /* Find or create trait in target */
         bool found = false;
-        for (size_t k = 0; k < target->trait_count; k++) {
-          if (strcmp(target->traits[k].name, trait_name) == 0) {
+        size_t scan = (target->trait_fingerprint & CIV_TRAIT_BIT(trait_hash))
+                          ? target->trait_count
+                          : 0;
+        for (size_t k = 0; k < scan; k++) {
+          if (target->traits[k].name_hash == trait_hash &&
+              strcmp(target->traits[k].name, trait_name) == 0) {
             found = true;
             /* Increase trait strength based on assimilation */
             civ_float_t adoption =
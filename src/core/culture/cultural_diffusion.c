@@ -72,12 +72,17 @@ civ_cultural_diffusion_process(civ_cultural_diffusion_t *diffusion,
       /* Diffuse traits from source to target */
       for (size_t k = 0; k < source->trait_count; k++) {
         const char *trait_name = source->traits[k].name;
+        uint32_t trait_hash = source->traits[k].name_hash;
         civ_float_t source_strength = source->traits[k].strength;
 
         /* Find or create trait in target */
         bool found = false;
-        for (size_t l = 0; l < target->trait_count; l++) {
-          if (strcmp(target->traits[l].name, trait_name) == 0) {
+        size_t scan = (target->trait_fingerprint & CIV_TRAIT_BIT(trait_hash))
+                          ? target->trait_count
+                          : 0;
+        for (size_t l = 0; l < scan; l++) {
+          if (target->traits[l].name_hash == trait_hash &&
+              strcmp(target->traits[l].name, trait_name) == 0) {
             found = true;
             /* Apply diffusion */
             civ_float_t rate = civ_cultural_diffusion_calculate_rate(
@@ -112,9 +117,11 @@ civ_result_t civ_cultural_diffusion_diffuse_trait(
   }
 
   /* Find trait in source */
+  uint32_t trait_hash = civ_hash_string(trait_name);
   civ_float_t source_strength = 0.0f;
   for (size_t i = 0; i < source->trait_count; i++) {
-    if (strcmp(source->traits[i].name, trait_name) == 0) {
+    if (source->traits[i].name_hash == trait_hash &&
+        strcmp(source->traits[i].name, trait_name) == 0) {
       source_strength = source->traits[i].strength;
       break;
     }
@@ -132,7 +139,8 @@ civ_result_t civ_cultural_diffusion_diffuse_trait(
   /* Find or create trait in target */
   bool found = false;
   for (size_t i = 0; i < target->trait_count; i++) {
-    if (strcmp(target->traits[i].name, trait_name) == 0) {
+    if (target->traits[i].name_hash == trait_hash &&
+        strcmp(target->traits[i].name, trait_name) == 0) {
       found = true;
       target->traits[i].strength =
           CLAMP(target->traits[i].strength + rate, 0.0f, 1.0f);
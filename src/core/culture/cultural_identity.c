@@ -109,6 +109,8 @@ civ_result_t civ_cultural_identity_add_trait(civ_cultural_identity_t *identity,
   if (identity->traits) {
     civ_cultural_trait_t *trait = &identity->traits[identity->trait_count++];
     strncpy(trait->name, trait_name, sizeof(trait->name) - 1);
+    trait->name_hash = civ_hash_string(trait->name);
+    identity->trait_fingerprint |= CIV_TRAIT_BIT(trait->name_hash);
     trait->strength = strength;
     trait->influence = strength * 0.5f;
   } else {
@@ -153,13 +155,20 @@ civ_cultural_identity_calculate_similarity(const civ_cultural_identity_t *a,
   if (!a || !b)
     return 0.0f;
 
+  /* Disjoint fingerprints mean no trait name can be shared */
+  if ((a->trait_fingerprint & b->trait_fingerprint) == 0)
+    return 0.0f;
+
   /* Calculate similarity based on shared traits */
   civ_float_t similarity = 0.0f;
   size_t matches = 0;
 
   for (size_t i = 0; i < a->trait_count; i++) {
+    if (!(b->trait_fingerprint & CIV_TRAIT_BIT(a->traits[i].name_hash)))
+      continue;
     for (size_t j = 0; j < b->trait_count; j++) {
-      if (strcmp(a->traits[i].name, b->traits[j].name) == 0) {
+      if (a->traits[i].name_hash == b->traits[j].name_hash &&
+          strcmp(a->traits[i].name, b->traits[j].name) == 0) {
         civ_float_t strength_diff = (civ_float_t)fabs(
             (double)(a->traits[i].strength - b->traits[j].strength));
         similarity += 1.0f - strength_diff;
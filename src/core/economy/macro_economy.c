@@ -145,14 +145,13 @@ civ_market_dynamics_update(civ_market_dynamics_t *market,
 
   market->sentiment = report.sentiment;
 
-  /* Store report */
+  /* Store report, overwriting the oldest once the history is full */
   if (market->report_count < market->report_capacity) {
-    market->reports[market->report_count++] = report;
+    market->reports[(market->report_head + market->report_count++) %
+                    market->report_capacity] = report;
   } else {
-    /* Shift reports */
-    memmove(market->reports, market->reports + 1,
-            (market->report_capacity - 1) * sizeof(civ_economic_report_t));
-    market->reports[market->report_capacity - 1] = report;
+    market->reports[market->report_head] = report;
+    market->report_head = (market->report_head + 1) % market->report_capacity;
   }
 
   return report;
@@ -165,7 +164,8 @@ civ_market_dynamics_get_report(const civ_market_dynamics_t *market) {
   if (!market || market->report_count == 0)
     return report;
 
-  return market->reports[market->report_count - 1];
+  return market->reports[(market->report_head + market->report_count - 1) %
+                         market->report_capacity];
 }
 
 void civ_market_dynamics_set_tax_rate(civ_market_dynamics_t *market,
@@ -39,6 +39,13 @@ void civ_manufacturing_update(civ_manufacturing_system_t *m, civ_float_t time_de
   int total_workers_assigned = 0;
   int total_capacity = 0;
 
+  civ_float_t auto_bonus = 1.0 + m->automation_level * 0.5;
+  civ_float_t base_output = (1.0 + tech_level * 0.8) * auto_bonus
+                            * m->supply_chain_efficiency;
+  /* Raw materials are split across every factory, idle ones included */
+  civ_float_t raw_per_factory = (m->factory_count > 0 && raw_materials_available > 0)
+    ? raw_materials_available / m->factory_count : 1.0;
+
   for (int i = 0; i < m->factory_count; i++) {
     civ_factory_t *f = &m->factories[i];
     if (!f->active) continue;
@@ -54,15 +61,10 @@ void civ_manufacturing_update(civ_manufacturing_system_t *m, civ_float_t time_de
     }
 
     /* Output: workers * productivity * supply_chain * automation bonus */
-    civ_float_t auto_bonus = 1.0 + m->automation_level * 0.5;
-    /* Raw material constraint */
-    civ_float_t raw_per_factory = (m->factory_count > 0 && raw_materials_available > 0)
-      ? raw_materials_available / m->factory_count : 1.0;
     civ_float_t raw_eff = (raw_per_factory > f->raw_material_ratio)
       ? 1.0 : raw_per_factory / (f->raw_material_ratio + 0.001);
 
-    f->output_per_worker = (1.0 + tech_level * 0.8) * auto_bonus
-                           * m->supply_chain_efficiency * raw_eff;
+    f->output_per_worker = base_output * raw_eff;
     civ_float_t factory_output = f->workers * f->output_per_worker;
     m->total_industrial_output += factory_output;
     total_capacity += f->capacity;
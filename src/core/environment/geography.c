@@ -105,15 +105,28 @@ civ_float_t civ_geography_calculate_distance(civ_coordinate_t a,
 }
 
 civ_float_t civ_geography_get_agricultural_area(const civ_geography_t *geo) {
-  if (!geo)
-    return 0.0f;
+  civ_float_t agricultural = 0.0f;
+  civ_geography_get_land_area(geo, &agricultural);
+  return agricultural;
+}
 
+/* Total patch area, with the agricultural share collected in the same pass
+ * for callers that need both every tick */
+civ_float_t civ_geography_get_land_area(const civ_geography_t *geo,
+                                        civ_float_t *agricultural_area) {
   civ_float_t total = 0.0f;
-  for (size_t i = 0; i < geo->patch_count; i++) {
-    if (geo->land_patches[i].land_use == CIV_LAND_USE_AGRICULTURE) {
+  civ_float_t agricultural = 0.0f;
+
+  if (geo) {
+    for (size_t i = 0; i < geo->patch_count; i++) {
       total += geo->land_patches[i].area;
+      if (geo->land_patches[i].land_use == CIV_LAND_USE_AGRICULTURE) {
+        agricultural += geo->land_patches[i].area;
+      }
     }
   }
 
+  if (agricultural_area)
+    *agricultural_area = agricultural;
   return total;
 }
@@ -573,12 +573,12 @@ void civ_game_update(civ_game_t *game) {
     regulation_level = (civ_float_t)game->economic_policy->regulation * 0.25;
 
   /* Geography */
-  civ_float_t arable_area    = game->geography ? civ_geography_get_agricultural_area(game->geography) : 2000.0;
+  civ_float_t arable_area    = 2000.0;
   civ_float_t geography_size = 10000.0;
-  if (game->geography && game->geography->patch_count > 0) {
-    geography_size = 0.0;
-    for (size_t pi = 0; pi < game->geography->patch_count; pi++)
-      geography_size += game->geography->land_patches[pi].area;
+  if (game->geography) {
+    civ_float_t land_area = civ_geography_get_land_area(game->geography, &arable_area);
+    if (game->geography->patch_count > 0)
+      geography_size = land_area;
   }
   if (geography_size < 100.0) geography_size = 100.0;
 
@@ -245,16 +245,14 @@ int civ_conquest_transfer_territory(civ_conquest_system_t *system,
         total_transferred += transferred;
     }
 
-    /* Clean up applied conquests */
-    for (size_t i = 0; i < system->conquest_count; ) {
-        if (system->conquests[i].territory_applied) {
-            memmove(&system->conquests[i], &system->conquests[i + 1],
-                   (system->conquest_count - i - 1) * sizeof(civ_conquest_event_t));
-            system->conquest_count--;
-        } else {
-            i++;
-        }
+    /* Clean up applied conquests (single compaction pass, order preserved) */
+    size_t kept = 0;
+    for (size_t i = 0; i < system->conquest_count; i++) {
+        if (system->conquests[i].territory_applied) continue;
+        if (kept != i) system->conquests[kept] = system->conquests[i];
+        kept++;
     }
+    system->conquest_count = kept;
 
     return total_transferred;
 }
@@ -11,27 +11,27 @@
 
 #define DEFAULT_AGE_GROUPS 7
 
+/* Standard age groups: 0-14, 15-24, 25-34, 35-44, 45-54, 55-64, 65+ */
+static const int32_t age_ranges[DEFAULT_AGE_GROUPS][2] = {
+    {0, 14}, {15, 24}, {25, 34}, {35, 44}, {45, 54}, {55, 64}, {65, 100}
+};
+static const civ_float_t fertility_rates[DEFAULT_AGE_GROUPS] = {0.0f, 0.3f, 0.4f, 0.3f, 0.1f, 0.0f, 0.0f};
+static const civ_float_t mortality_rates[DEFAULT_AGE_GROUPS] = {0.01f, 0.005f, 0.01f, 0.02f, 0.04f, 0.08f, 0.15f};
+
+/* Initial pyramid distribution (sums to 1.0) */
+static const civ_float_t age_distribution[DEFAULT_AGE_GROUPS] = {0.25f, 0.20f, 0.18f, 0.15f, 0.12f, 0.07f, 0.03f};
+
 static void initialize_age_groups(civ_demographics_t* demo, int64_t initial_pop) {
-    /* Standard age groups: 0-14, 15-24, 25-34, 35-44, 45-54, 55-64, 65+ */
-    int32_t age_ranges[][2] = {
-        {0, 14}, {15, 24}, {25, 34}, {35, 44}, {45, 54}, {55, 64}, {65, 100}
-    };
-    
-    civ_float_t fertility_rates[] = {0.0f, 0.3f, 0.4f, 0.3f, 0.1f, 0.0f, 0.0f};
-    civ_float_t mortality_rates[] = {0.01f, 0.005f, 0.01f, 0.02f, 0.04f, 0.08f, 0.15f};
-    
     demo->age_group_count = DEFAULT_AGE_GROUPS;
     demo->age_groups = (civ_age_group_t*)CIV_CALLOC(demo->age_group_count, sizeof(civ_age_group_t));
     
     if (!demo->age_groups) return;
     
     /* Distribute population across age groups (pyramid distribution) */
-    civ_float_t distribution[] = {0.25f, 0.20f, 0.18f, 0.15f, 0.12f, 0.07f, 0.03f};
-    
     for (size_t i = 0; i < demo->age_group_count; i++) {
         demo->age_groups[i].min_age = age_ranges[i][0];
         demo->age_groups[i].max_age = age_ranges[i][1];
-        demo->age_groups[i].count = (int32_t)(initial_pop * distribution[i]);
+        demo->age_groups[i].count = (int32_t)(initial_pop * age_distribution[i]);
         demo->age_groups[i].fertility_rate = fertility_rates[i];
         demo->age_groups[i].mortality_rate = mortality_rates[i];
     }
@@ -156,11 +156,7 @@ civ_result_t civ_system_orchestrator_update_all(civ_system_orchestrator_t* so, c
         }
         
         if (updatable->update) {
-            clock_t start = clock();
             civ_result_t update_result = updatable->update(updatable->system, time_delta);
-            clock_t end = clock();
-            
-            civ_float_t update_time = ((civ_float_t)(end - start)) / CLOCKS_PER_SEC * 1000.0f;
             
             if (CIV_FAILED(update_result)) {
                 civ_log(CIV_LOG_WARNING, "System update failed: %s", update_result.message);
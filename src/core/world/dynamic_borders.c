@@ -86,6 +86,16 @@ civ_result_t civ_dynamic_borders_create_segment(civ_dynamic_borders_t* db,
     return result;
 }
 
+/* Per-tick tension drift by border type, indexed by civ_border_type_t */
+static const civ_float_t border_type_tension_rate[] = {
+    [CIV_BORDER_TYPE_NATURAL]     = -0.02f,
+    [CIV_BORDER_TYPE_POLITICAL]   = 0.0f,
+    [CIV_BORDER_TYPE_DISPUTED]    = 0.05f,
+    [CIV_BORDER_TYPE_MILITARIZED] = 0.0f,
+    [CIV_BORDER_TYPE_OPEN]        = 0.0f,
+    [CIV_BORDER_TYPE_CLOSED]      = 0.0f
+};
+
 void civ_dynamic_borders_update(civ_dynamic_borders_t* db, civ_float_t time_delta) {
     if (!db) return;
     
@@ -97,11 +107,9 @@ void civ_dynamic_borders_update(civ_dynamic_borders_t* db, civ_float_t time_delt
         segment->tension_level = MAX(0.0f, segment->tension_level - 0.01f * time_delta);
         
         /* Border type affects tension */
-        if (segment->border_type == CIV_BORDER_TYPE_DISPUTED) {
-            segment->tension_level = MIN(1.0f, segment->tension_level + 0.05f * time_delta);
-        } else if (segment->border_type == CIV_BORDER_TYPE_NATURAL) {
-            segment->tension_level = MAX(0.0f, segment->tension_level - 0.02f * time_delta);
-        }
+        segment->tension_level = CLAMP(segment->tension_level +
+                                       border_type_tension_rate[segment->border_type] * time_delta,
+                                       0.0f, 1.0f);
     }
 }
 
@@ -216,6 +216,8 @@ void civ_map_view_manager_transition_view(civ_map_view_manager_t *manager,
 
   civ_map_view_t *current_view = &manager->views[manager->current_view];
   civ_map_view_t *target_view = &manager->views[new_view];
+  size_t tile_count = (size_t)manager->base_map->width *
+                      (size_t)manager->base_map->height;
 
   // Start transition
   float opacity = 0.0f;
@@ -224,17 +226,13 @@ void civ_map_view_manager_transition_view(civ_map_view_manager_t *manager,
     if (opacity > 1.0f)
       opacity = 1.0f;
 
-    // Blend the two views based on opacity
-    for (int32_t y = 0; y < manager->base_map->height; y++) {
-      for (int32_t x = 0; x < manager->base_map->width; x++) {
-        float current_value = current_view->data[y * current_view->width + x];
-        float target_value = target_view->data[y * target_view->width + x];
-        float blended_value =
-            current_value * (1.0f - opacity) + target_value * opacity;
-
-        // Update the current view data with the blended value
-        current_view->data[y * current_view->width + x] = blended_value;
-      }
+    // Blend the two views based on opacity. Both grids are sized from the
+    // base map, so walk them as one flat array the compiler can vectorize.
+    civ_float_t keep = 1.0f - opacity;
+    civ_float_t *cur = current_view->data;
+    const civ_float_t *tgt = target_view->data;
+    for (size_t i = 0; i < tile_count; i++) {
+      cur[i] = cur[i] * keep + tgt[i] * opacity;
     }
 
     // Render the blended view (placeholder for actual rendering logic)
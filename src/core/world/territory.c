@@ -79,6 +79,15 @@ civ_result_t civ_territory_region_add_point(civ_territory_region_t* region, civ_
     if (region->boundary_points) {
         region->boundary_points[region->point_count].x = x;
         region->boundary_points[region->point_count].y = y;
+        if (region->point_count == 0) {
+            region->bounds_min.x = region->bounds_max.x = x;
+            region->bounds_min.y = region->bounds_max.y = y;
+        } else {
+            region->bounds_min.x = MIN(region->bounds_min.x, x);
+            region->bounds_min.y = MIN(region->bounds_min.y, y);
+            region->bounds_max.x = MAX(region->bounds_max.x, x);
+            region->bounds_max.y = MAX(region->bounds_max.y, y);
+        }
         region->point_count++;
     } else {
         result.error = CIV_ERROR_OUT_OF_MEMORY;
@@ -87,6 +96,26 @@ civ_result_t civ_territory_region_add_point(civ_territory_region_t* region, civ_
     return result;
 }
 
+/* Area (shoelace) and vertex-mean centroid in one walk of the boundary.
+ * The public calculate_* functions and add_region all go through here. */
+static void territory_region_measure(const civ_territory_region_t* region,
+                                     civ_float_t* area_out, civ_float_t* cx_out, civ_float_t* cy_out) {
+    size_t n = region->point_count;
+    civ_float_t area = 0.0f, cx = 0.0f, cy = 0.0f;
+    for (size_t i = 0; i < n; i++) {
+        const civ_territory_point_t* p = &region->boundary_points[i];
+        const civ_territory_point_t* q = &region->boundary_points[i + 1 < n ? i + 1 : 0];
+        area += p->x * q->y;
+        area -= q->x * p->y;
+        cx += p->x;
+        cy += p->y;
+    }
+    
+    *area_out = fabsf(area) / 2.0f;
+    *cx_out = n > 0 ? cx / (civ_float_t)n : 0.0f;
+    *cy_out = n > 0 ? cy / (civ_float_t)n : 0.0f;
+}
+
 civ_result_t civ_territory_region_calculate_area(civ_territory_region_t* region) {
     civ_result_t result = {CIV_OK, NULL};
     
@@ -95,14 +124,8 @@ civ_result_t civ_territory_region_calculate_area(civ_territory_region_t* region)
         return result;
     }
     
-    /* Shoelace formula for polygon area */
-    civ_float_t area = 0.0f;
-    for (size_t i = 0; i < region->point_count; i++) {
-        size_t j = (i + 1) % region->point_count;
-        area += region->boundary_points[i].x * region->boundary_points[j].y;
-        area -= region->boundary_points[j].x * region->boundary_points[i].y;
-    }
-    region->area = fabsf(area) / 2.0f;
+    civ_float_t cx, cy;
+    territory_region_measure(region, &region->area, &cx, &cy);
     
     return result;
 }
@@ -115,15 +138,8 @@ civ_result_t civ_territory_region_calculate_centroid(civ_territory_region_t* reg
         return result;
     }
     
-    /* Calculate centroid of polygon */
-    civ_float_t cx = 0.0f, cy = 0.0f;
-    for (size_t i = 0; i < region->point_count; i++) {
-        cx += region->boundary_points[i].x;
-        cy += region->boundary_points[i].y;
-    }
-    
-    region->centroid.latitude = cx / (civ_float_t)region->point_count;
-    region->centroid.longitude = cy / (civ_float_t)region->point_count;
+    civ_float_t area;
+    territory_region_measure(region, &area, &region->centroid.latitude, &region->centroid.longitude);
     
     return result;
 }
@@ -131,6 +147,12 @@ civ_result_t civ_territory_region_calculate_centroid(civ_territory_region_t* reg
 bool civ_territory_region_contains_point(const civ_territory_region_t* region, civ_float_t x, civ_float_t y) {
     if (!region || region->point_count < 3) return false;
     
+    /* Cheap reject before walking every edge; most regions miss most queries */
+    if ((x < region->bounds_min.x) | (x > region->bounds_max.x) |
+        (y < region->bounds_min.y) | (y > region->bounds_max.y)) {
+        return false;
+    }
+    
     /* Point-in-polygon test using ray casting */
     bool inside = false;
     for (size_t i = 0, j = region->point_count - 1; i < region->point_count; j = i++) {
@@ -162,8 +184,11 @@ civ_result_t civ_territory_manager_add_region(civ_territory_manager_t* manager,
     
     if (manager->regions) {
         /* Calculate area and centroid */
-        civ_territory_region_calculate_area(region);
-        civ_territory_region_calculate_centroid(region);
+        if (region->point_count > 0) {
+            civ_float_t area;
+            territory_region_measure(region, &area, &region->centroid.latitude, &region->centroid.longitude);
+            if (region->point_count >= 3) region->area = area;
+        }
         
         manager->regions[manager->region_count++] = *region;
     } else {
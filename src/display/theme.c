@@ -52,10 +52,11 @@ void civ_theme_init_default(void) {
 }
 
 uint32_t civ_theme_mix(uint32_t a, uint32_t b, float t) {
-  uint8_t ar = (a >> 16) & 0xFF, ag = (a >> 8) & 0xFF, ab = a & 0xFF;
-  uint8_t br = (b >> 16) & 0xFF, bg = (b >> 8) & 0xFF, bb = b & 0xFF;
-  uint8_t mr = (uint8_t)(ar + (br - ar) * t);
-  uint8_t mg = (uint8_t)(ag + (bg - ag) * t);
-  uint8_t mb = (uint8_t)(ab + (bb - ab) * t);
-  return 0xFF000000 | ((uint32_t)mr << 16) | ((uint32_t)mg << 8) | mb;
+  /* 8.8 fixed-point weight; red and blue share one multiply in separate
+   * 16-bit lanes (255 * 256 cannot carry into the neighbouring lane). */
+  uint32_t wb = t <= 0.0f ? 0 : t >= 1.0f ? 256 : (uint32_t)(t * 256.0f);
+  uint32_t wa = 256 - wb;
+  uint32_t rb = (((a & 0xFF00FF) * wa + (b & 0xFF00FF) * wb) >> 8) & 0xFF00FF;
+  uint32_t g = (((a & 0x00FF00) * wa + (b & 0x00FF00) * wb) >> 8) & 0x00FF00;
+  return 0xFF000000 | rb | g;
 }
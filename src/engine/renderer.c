@@ -199,15 +199,34 @@ void civ_render_map_context_destroy(civ_render_map_context_t *ctx) {
 }
 
 /* ── Elevation-to-color gradient (geographical view) ──────────────── */
+/* Bands are multiples of 0.05, so the gradient is resampled into 20
+ * buckets and looked up instead of walked per pixel. */
+#define ELEVATION_BUCKETS 20
+static const uint32_t elevation_palette[ELEVATION_BUCKETS] = {
+  0xFF0B2C4D,                           /* deep water      < 0.05 */
+  0xFF15406A, 0xFF15406A, 0xFF15406A,   /* shallow water   < 0.20 */
+  0xFF1A5C3A, 0xFF1A5C3A,               /* coastal lowland < 0.30 */
+  0xFF2D8C3C, 0xFF2D8C3C,               /* grassland       < 0.40 */
+  0xFF4DA830, 0xFF4DA830, 0xFF4DA830,   /* forest/hills    < 0.55 */
+  0xFF8B6914, 0xFF8B6914, 0xFF8B6914,   /* highland        < 0.70 */
+  0xFFA0855A, 0xFFA0855A, 0xFFA0855A,   /* mountain        < 0.85 */
+  0xFFE0E0E0, 0xFFE0E0E0, 0xFFE0E0E0,   /* snow peak */
+};
+/* Lower edge of each bucket as the float literal the bands were defined
+ * with; used to correct the one-off rounding of elev * 20 at an edge. */
+static const float elevation_bucket_floor[ELEVATION_BUCKETS + 1] = {
+  0.00f, 0.05f, 0.10f, 0.15f, 0.20f, 0.25f, 0.30f, 0.35f, 0.40f, 0.45f, 0.50f,
+  0.55f, 0.60f, 0.65f, 0.70f, 0.75f, 0.80f, 0.85f, 0.90f, 0.95f, 1.00f,
+};
+
 static uint32_t elevation_color(float elev) {
-  if (elev < 0.05f) return 0xFF0B2C4D;  /* deep water */
-  if (elev < 0.20f) return 0xFF15406A;  /* shallow water */
-  if (elev < 0.30f) return 0xFF1A5C3A;  /* coastal lowland */
-  if (elev < 0.40f) return 0xFF2D8C3C;  /* grassland */
-  if (elev < 0.55f) return 0xFF4DA830;  /* forest/hills */
-  if (elev < 0.70f) return 0xFF8B6914;  /* highland */
-  if (elev < 0.85f) return 0xFFA0855A;  /* mountain */
-  return 0xFFE0E0E0;                     /* snow peak */
+  float e = elev * (float)ELEVATION_BUCKETS;
+  int i = !(e > 0.0f) ? 0
+        : e >= (float)(ELEVATION_BUCKETS - 1) ? ELEVATION_BUCKETS - 1
+        : (int)e;
+  i -= (i > 0) & (elev < elevation_bucket_floor[i]);
+  i += (i < ELEVATION_BUCKETS - 1) & (elev >= elevation_bucket_floor[i + 1]);
+  return elevation_palette[i];
 }
 
 /* ── Resource-to-color mapping (economic view) ───────────────────── */
@@ -453,32 +472,35 @@ void civ_render_map(SDL_Renderer *renderer, civ_render_map_context_t *ctx,
     ctx->view_y = ctx->map_height - half_h;
 
   /* Render map to pixel buffer */
+  const float map_w = (float)ctx->map_width;
+  const float fx_origin = ctx->view_x - (fb_width / 2.0f) * inv_scale;
   for (int y = 0; y < fb_height; y++) {
     uint32_t *row = &ctx->pixel_buffer[y * fb_width];
 
-    for (int x = 0; x < fb_width; x++) {
-      /* Calculate world coordinates from view context */
-      /* MASTERPIECE 2.0: Correct coordinate spacing with WORLD_UNIT_SIZE */
-      float fx =
-          ctx->view_x + (x - fb_width / 2.0f) / (ctx->zoom * WORLD_UNIT_SIZE);
-      float fy =
-          ctx->view_y + (y - fb_height / 2.0f) / (ctx->zoom * WORLD_UNIT_SIZE);
-
-      /* MASTERPIECE 2.0: Spherical Realism (Equatorial Wrap, Polar Clamp) */
-      /* 1. East-West Circumnavigation (Wrapping) */
-      fx = fmodf(fx, (float)ctx->map_width);
-      if (fx < 0)
-        fx += (float)ctx->map_width;
-
-      /* 2. North-South Stability (Clamping) */
-      /* If we are past the poles, render deep space / ocean depth */
-      if (fy < 0 || fy >= (float)ctx->map_height) {
+    /* MASTERPIECE 2.0: Correct coordinate spacing with WORLD_UNIT_SIZE */
+    float fy = ctx->view_y + (y - fb_height / 2.0f) * inv_scale;
+
+    /* MASTERPIECE 2.0: Spherical Realism (Equatorial Wrap, Polar Clamp) */
+    /* North-South Stability (Clamping): past the poles the whole row is
+       deep space, so fill it without touching the map */
+    if (fy < 0 || fy >= (float)ctx->map_height) {
+      for (int x = 0; x < fb_width; x++)
         row[x] = 0xFF020408; /* Deep Space Black */
-        continue;
+      continue;
+    }
+    int32_t wy = (int32_t)fy;
+
+    for (int x = 0; x < fb_width; x++) {
+      /* East-West Circumnavigation (Wrapping); fmodf only when the
+         sample actually leaves the map */
+      float fx = fx_origin + x * inv_scale;
+      if (fx < 0 || fx >= map_w) {
+        fx = fmodf(fx, map_w);
+        if (fx < 0)
+          fx += map_w;
       }
 
       int32_t wx = (int32_t)fx;
-      int32_t wy = (int32_t)fy;
 
       civ_map_tile_t *tile = civ_map_get_tile(map, wx, wy);
       if (!tile) {
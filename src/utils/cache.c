@@ -45,11 +45,12 @@ civ_result_t civ_cache_set(civ_cache_t* cache, const char* key, const void* data
     }
     
     /* Check if entry exists */
+    uint32_t key_hash = civ_hash_string(key);
     civ_cache_entry_t* entry = cache->entries;
     civ_cache_entry_t* prev = NULL;
     
     while (entry) {
-        if (strcmp(entry->key, key) == 0) {
+        if (entry->key_hash == key_hash && strcmp(entry->key, key) == 0) {
             /* Update existing entry */
             if (entry->data_size != data_size) {
                 CIV_FREE(entry->data);
@@ -74,9 +75,10 @@ civ_result_t civ_cache_set(civ_cache_t* cache, const char* key, const void* data
         /* Remove oldest entry */
         civ_cache_cleanup_expired(cache);
         if (cache->entry_count >= cache->max_entries && cache->entries) {
-            /* Remove first entry */
+            /* Remove first (oldest) entry */
             civ_cache_entry_t* oldest = cache->entries;
             cache->entries = oldest->next;
+            if (cache->tail == oldest) cache->tail = NULL;
             cache->current_size -= oldest->data_size;
             CIV_FREE(oldest->data);
             CIV_FREE(oldest);
@@ -99,6 +101,7 @@ civ_result_t civ_cache_set(civ_cache_t* cache, const char* key, const void* data
     
     memset(entry, 0, sizeof(civ_cache_entry_t));
     strncpy(entry->key, key, sizeof(entry->key) - 1);
+    entry->key_hash = civ_hash_string(entry->key);
     entry->data = CIV_MALLOC(data_size);
     if (!entry->data) {
         CIV_FREE(entry);
@@ -111,8 +114,13 @@ civ_result_t civ_cache_set(civ_cache_t* cache, const char* key, const void* data
     entry->timestamp = time(NULL);
     entry->expiry = entry->timestamp + (ttl > 0 ? ttl : cache->default_ttl);
     
-    entry->next = cache->entries;
-    cache->entries = entry;
+    /* Append so the list head stays the oldest entry for eviction */
+    if (cache->tail) {
+        cache->tail->next = entry;
+    } else {
+        cache->entries = entry;
+    }
+    cache->tail = entry;
     cache->entry_count++;
     cache->current_size += data_size;
     
@@ -128,10 +136,11 @@ civ_result_t civ_cache_get(civ_cache_t* cache, const char* key, void* out, size_
     }
     
     time_t now = time(NULL);
+    uint32_t key_hash = civ_hash_string(key);
     civ_cache_entry_t* entry = cache->entries;
     
     while (entry) {
-        if (strcmp(entry->key, key) == 0) {
+        if (entry->key_hash == key_hash && strcmp(entry->key, key) == 0) {
             /* Check if expired */
             if (entry->expiry > 0 && now > entry->expiry) {
                 result.error = CIV_ERROR_NOT_FOUND;
@@ -159,16 +168,18 @@ civ_result_t civ_cache_get(civ_cache_t* cache, const char* key, void* out, size_
 void civ_cache_remove(civ_cache_t* cache, const char* key) {
     if (!cache || !key) return;
     
+    uint32_t key_hash = civ_hash_string(key);
     civ_cache_entry_t* entry = cache->entries;
     civ_cache_entry_t* prev = NULL;
     
     while (entry) {
-        if (strcmp(entry->key, key) == 0) {
+        if (entry->key_hash == key_hash && strcmp(entry->key, key) == 0) {
             if (prev) {
                 prev->next = entry->next;
             } else {
                 cache->entries = entry->next;
             }
+            if (cache->tail == entry) cache->tail = prev;
             
             cache->current_size -= entry->data_size;
             cache->entry_count--;
@@ -193,6 +204,7 @@ void civ_cache_clear(civ_cache_t* cache) {
     }
     
     cache->entries = NULL;
+    cache->tail = NULL;
     cache->entry_count = 0;
     cache->current_size = 0;
 }
@@ -213,6 +225,7 @@ void civ_cache_cleanup_expired(civ_cache_t* cache) {
             } else {
                 cache->entries = next;
             }
+            if (cache->tail == entry) cache->tail = prev;
             
             cache->current_size -= entry->data_size;
             cache->entry_count--;
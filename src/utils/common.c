@@ -6,6 +6,16 @@
 #include "common.h"
 #include <stdarg.h>
 
+uint32_t civ_hash_string(const char* str) {
+    uint32_t hash = 5381;
+    if (!str) return hash;
+    
+    for (const unsigned char* p = (const unsigned char*)str; *p; p++) {
+        hash = ((hash << 5) + hash) + *p;
+    }
+    return hash;
+}
+
 void civ_log(civ_log_level_t level, const char* format, ...) {
     const char* level_names[] = {"DEBUG", "INFO", "WARNING", "ERROR", "FATAL"};
     va_list args;
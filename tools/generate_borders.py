@@ -20,7 +20,6 @@ import json
 import os
 import struct
 import sys
-import urllib.request
 
 ADMIN0_URL = (
     "https://raw.githubusercontent.com/nvkelso/"
@@ -36,6 +35,7 @@ def download_admin0(cache_path="/tmp/ne_10m_admin_0_countries.geojson"):
         print(f"Using cached {cache_path} ({size_mb:.1f} MB)")
         return cache_path
     print("Downloading Natural Earth 1:10m Admin 0 countries...")
+    import urllib.request
     urllib.request.urlretrieve(ADMIN0_URL, cache_path)
     size_mb = os.path.getsize(cache_path) / 1024 / 1024
     print(f"  Downloaded {size_mb:.1f} MB")
@@ -51,6 +51,7 @@ def lonlat_to_tile(lon, lat, width, height):
 
 def fill_polygon_scanline(mask, ring_coords, country_idx, width, height):
     """Even-odd rule polygon fill assigning country_idx to mask tiles."""
+    import numpy as np
     if len(ring_coords) < 3:
         return
 
@@ -60,24 +61,35 @@ def fill_polygon_scanline(mask, ring_coords, country_idx, width, height):
         px.append(x)
         py.append(y)
 
-    min_y = max(0, min(py))
-    max_y = min(height - 1, max(py))
-
-    for y in range(min_y, max_y + 1):
-        intersections = []
-        n = len(px)
-        for i in range(n):
-            j = (i + 1) % n
-            yi, yj = py[i], py[j]
-            if (yi <= y < yj) or (yj <= y < yi):
-                xi, xj = px[i], px[j]
-                if yj != yi:
-                    x_int = xi + (y - yi) * (xj - xi) / (yj - yi)
-                    intersections.append(x_int)
-                elif yi == y:
-                    intersections.append(float(xi))
-
-        intersections.sort()
+    # Edge i runs from vertex i to vertex i+1 (wrapping), stored as parallel
+    # arrays so all edges are processed in vectorized passes.
+    x0 = np.asarray(px, dtype=np.float64)
+    y0 = np.asarray(py, dtype=np.int64)
+    x1 = np.roll(x0, -1)
+    y1 = np.roll(y0, -1)
+
+    # Each edge crosses exactly the rows in [min(y0, y1), max(y0, y1)), so
+    # enumerate those (edge, row) pairs directly instead of testing every
+    # edge against every row. Horizontal edges span zero rows and drop out.
+    lo = np.minimum(y0, y1)
+    span = np.abs(y1 - y0)
+    total = int(span.sum())
+    if total == 0:
+        return
+    edge = np.repeat(np.arange(len(span)), span)
+    first = np.repeat(np.cumsum(span) - span, span)
+    rows = lo[edge] + (np.arange(total) - first)
+    hit_x = x0[edge] + (rows - y0[edge]) * (x1[edge] - x0[edge]) / (y1[edge] - y0[edge])
+
+    order = np.lexsort((hit_x, rows))
+    rows = rows[order]
+    hit_x = hit_x[order]
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+    ends = np.r_[starts[1:], total]
+
+    for start, end in zip(starts, ends):
+        y = int(rows[start])
+        intersections = hit_x[start:end]
         for k in range(0, len(intersections) - 1, 2):
             xs = max(0, int(intersections[k]))
             xe = min(width - 1, int(intersections[k + 1]))
@@ -216,14 +228,14 @@ def check_land_water_consistency(tile_grid, earth_map_path, width, height):
     Verify land tiles in the earth map have country assignments.
     Prints statistics about coverage.
     """
-    if not os.path.exists(earth_map_path):
+    try:
+        with open(earth_map_path, "rb") as f:
+            f.read(48)  # skip header (44 bytes + 4 reserved)
+            landmask = f.read(width * height)
+    except FileNotFoundError:
         print("  (earth map not found, skipping land/water consistency check)")
         return
 
-    with open(earth_map_path, "rb") as f:
-        f.read(48)  # skip header (44 bytes + 4 reserved)
-        landmask = f.read(width * height)
-
     import numpy as np
     land = np.frombuffer(landmask, dtype=np.uint8).reshape((height, width))
 
@@ -19,7 +19,6 @@ import math
 import os
 import struct
 import sys
-import urllib.request
 
 MAGIC = 0x54494349  # "ICIT" little-endian
 VERSION = 1
@@ -42,6 +41,7 @@ def download_places(cache_path="/tmp/ne_10m_populated_places.geojson"):
         print(f"Using cached {cache_path} ({size_mb:.1f} MB)")
         return cache_path
     print("Downloading Natural Earth 1:10m populated places...")
+    import urllib.request
     urllib.request.urlretrieve(POPULATED_PLACES_URL, cache_path)
     size_mb = os.path.getsize(cache_path) / 1024 / 1024
     print(f"  Downloaded {size_mb:.1f} MB")
@@ -24,7 +24,6 @@ import json
 import os
 import struct
 import sys
-import urllib.request
 
 MAGIC = 0x48545241
 VERSION = 1
@@ -40,6 +39,7 @@ def download_natural_earth(cache_path="/tmp/ne_10m_land.geojson"):
         print(f"Using cached {cache_path} ({os.path.getsize(cache_path)/1024/1024:.1f} MB)")
         return cache_path
     print(f"Downloading Natural Earth 1:10m land data...")
+    import urllib.request
     urllib.request.urlretrieve(NATURAL_EARTH_URL, cache_path)
     print(f"  Downloaded {os.path.getsize(cache_path)/1024/1024:.1f} MB")
     return cache_path
@@ -19,8 +19,6 @@ import argparse
 import os
 import struct
 import sys
-import urllib.request
-import urllib.error
 
 MAGIC = 0x47414C46  # "FLAG" little-endian
 VERSION = 1
@@ -30,12 +28,14 @@ FLAGCDN_BASE = "https://flagcdn.com/w160"
 
 def load_nation_iso_codes(nations_path):
     """Read nations.bin and return list of (id, iso_a2) tuples."""
-    if not os.path.exists(nations_path):
+    try:
+        f = open(nations_path, "rb")
+    except FileNotFoundError:
         print(f"Nations file not found: {nations_path}")
         print("Run generate_nations.py first.")
         return []
 
-    with open(nations_path, "rb") as f:
+    with f:
         magic, version, count = struct.unpack("<III", f.read(12))
         if magic != 0x4E414E54:
             print(f"Bad magic in nations file: 0x{magic:08X}")
@@ -95,17 +95,20 @@ def download_flag(iso_a2, flags_dir):
     filename = f"{iso_a2}.png"
     filepath = os.path.join(flags_dir, filename)
 
-    if os.path.exists(filepath):
-        # Already have it — get dimensions from file
-        try:
-            with open(filepath, "rb") as f:
-                # Quick PNG dimension extraction from IHDR
-                f.read(16)  # skip PNG signature
-                w = struct.unpack(">I", f.read(4))[0]
-                h = struct.unpack(">I", f.read(4))[0]
-                return filename, w, h
-        except Exception:
-            return filename, 160, 96  # default guess
+    # Already have it — get dimensions from file
+    try:
+        with open(filepath, "rb") as f:
+            # Quick PNG dimension extraction from IHDR
+            f.read(16)  # skip PNG signature
+            w = struct.unpack(">I", f.read(4))[0]
+            h = struct.unpack(">I", f.read(4))[0]
+            return filename, w, h
+    except FileNotFoundError:
+        pass
+    except Exception:
+        return filename, 160, 96  # default guess
+
+    import urllib.request
 
     url = f"{FLAGCDN_BASE}/{iso_a2}.png"
     try:
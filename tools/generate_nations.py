@@ -20,7 +20,6 @@ import json
 import os
 import struct
 import sys
-import urllib.request
 
 MAGIC = 0x4E414E54  # "TNAN" little-endian
 VERSION = 1
@@ -52,6 +51,7 @@ def download_admin0(cache_path="/tmp/ne_10m_admin_0_countries.geojson"):
         print(f"Using cached {cache_path} ({size_mb:.1f} MB)")
         return cache_path
     print("Downloading Natural Earth 1:10m Admin 0 countries...")
+    import urllib.request
     urllib.request.urlretrieve(ADMIN0_URL, cache_path)
     size_mb = os.path.getsize(cache_path) / 1024 / 1024
     print(f"  Downloaded {size_mb:.1f} MB")